@@ -6,9 +6,11 @@ syntax highlighting and optional radio detection.
 """
 
 import re
+import html
 import logging
 from datetime import datetime
-from typing import Optional, Dict, Tuple
+from functools import lru_cache
+from typing import Any, Optional, Dict, Iterable, Iterator, List, TextIO, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -23,46 +25,238 @@ ACTION_COLOR_MAP: Dict[str, str] = {
 }
 
 
+# Characters NAME_PATTERN accepts as a speaker's first letter; anything else
+# can be rejected without entering the regex engine
+_NAME_START_CHARS = frozenset("ABCDEFGHIJKLMNOPQRSTUVWXYZĄĆĘŁŃÓŚŹŻ")
+
+# Static parts of format_line's output, filled with a single %-format call;
+# the action span comes pre-rendered from _ACTION_HTML_TEMPLATE
+_LINE_HTML_TEMPLATE = (
+    '<span style="color: #AAAAAA; font-weight: bold;">[%s]</span> '
+    '<span style="color: #00BFFF; font-weight: bold;">[%s]</span> '
+    '%s'
+    '<span style="color: #FFFFFF; font-weight: bold;">%s </span>'
+    '<span style="color: #CCCCCC;">%s</span>'
+)
+
+_ACTION_HTML_TEMPLATE = '<span style="color: %s; font-weight: bold;">[%s]</span> '
+
+_LOG_PATTERN = re.compile(
+    r"^\[(?P<timestamp>[^\]]+)\]\s+\[(?P<action>[^\]]+)\]\s+(?P<message>.*)$"
+)
+
+_NAME_PATTERN = re.compile(
+    r"^(?P<name>[A-ZĄĆĘŁŃÓŚŹŻ][\w\s\-\']+?)\s+"
+    r"(?P<tone>mówi|szepcze|krzyczy)"
+    r"(?:\s*\((?P<extra>[^)]+)\))?"  # e.g., (radio)
+    r"(?:\s+do\s+[A-ZĄĆĘŁŃÓŚŹŻ][\w\s\-\']+?)?:\s*"
+)
+
+# NAME_PATTERN without the anchor, so it can match at an offset in a line
+_SPEAKER_PATTERN = re.compile(_NAME_PATTERN.pattern[1:])
+
+
+def _escape_html(text: str) -> str:
+    """
+    Escapes log text for HTML output. Game logs already carry some
+    entities (e.g. &#8594;) next to raw '<', '>' and '&', so entities are
+    decoded first and everything is escaped once. Text with none of these
+    characters, the common case, is returned as is.
+    """
+    if "&" not in text and "<" not in text and ">" not in text:
+        return text
+    return html.escape(html.unescape(text), quote=False)
+
+
+def _split_header(line: str) -> Optional[Tuple[str, str, int]]:
+    """
+    Splits "[timestamp] [action] message" with plain index arithmetic,
+    accepting exactly what LOG_PATTERN accepts.
+    Returns (timestamp, stripped action, message_start) or None.
+    """
+    # Shortest possible match is "[t] [a] "
+    if len(line) < 8 or line[0] != "[":
+        return None
+    end = len(line)
+
+    ts_end = line.find("]", 1)
+    if ts_end < 2:
+        return None
+    pos = ts_end + 1
+    while pos < end and line[pos].isspace():
+        pos += 1
+    if pos == ts_end + 1 or pos == end or line[pos] != "[":
+        return None
+
+    action_end = line.find("]", pos + 1)
+    if action_end < pos + 2:
+        return None
+    message_start = action_end + 1
+    while message_start < end and line[message_start].isspace():
+        message_start += 1
+    if message_start == action_end + 1:
+        return None
+
+    # "." stops at newlines, so only a single trailing one is tolerated
+    newline = line.find("\n", message_start)
+    if newline != -1 and newline != end - 1:
+        return None
+
+    # Trim the action by index so only the final slice is allocated
+    action_start = pos + 1
+    while action_start < action_end and line[action_start].isspace():
+        action_start += 1
+    while action_end > action_start and line[action_end - 1].isspace():
+        action_end -= 1
+    return line[1:ts_end], line[action_start:action_end], message_start
+
+
+def _speaker_head_end(text: str, start: int) -> int:
+    """
+    Returns the index just past the colon that would end a speaker prefix
+    starting at `start`, or -1 if SPEAKER_PATTERN cannot match there.
+    Names and addressees never contain ":", "(" or ")", so the prefix ends
+    at the first colon, or at the first colon after "(extra)" if the
+    parenthesis opens before it.
+    """
+    colon = text.find(":", start)
+    if colon == -1:
+        return -1
+    paren = text.find("(", start, colon)
+    if paren != -1:
+        close = text.find(")", paren)
+        if close == -1:
+            return -1
+        colon = text.find(":", close)
+        if colon == -1:
+            return -1
+    return colon + 1
+
+
+@lru_cache(maxsize=4096)
+def _match_speaker(head: str) -> Optional[Tuple[str, str, str]]:
+    """
+    Matches SPEAKER_PATTERN against a prefix head cut by _speaker_head_end.
+    Returns (prefix, extra, name) or None. Memoized: the same few speakers
+    open most lines of an interrogation log.
+    """
+    match = _SPEAKER_PATTERN.match(head)
+    if not match:
+        return None
+    # The head starts at a capital and ends at the prefix colon, so it
+    # already is the stripped prefix
+    return head, match.group("extra") or "", match.group("name")
+
+
+def _find_speaker(text: str, start: int) -> Tuple[Optional[Tuple[str, str, str]], int]:
+    """
+    Looks up the speaker prefix at text[start:].
+    Returns (_match_speaker result or None, index just past the prefix).
+    """
+    if text[start:start + 1] not in _NAME_START_CHARS:
+        return None, start
+    head_end = _speaker_head_end(text, start)
+    if head_end == -1:
+        return None, start
+    return _match_speaker(text[start:head_end]), head_end
+
+
+def _split_speaker(text: str, start: int) -> Tuple[str, str, int]:
+    """
+    Splits the speaker prefix off text[start:].
+    Returns (prefix, extra, message_start); prefix is empty when there is
+    no speaker, in which case message_start is `start`.
+    """
+    speaker, head_end = _find_speaker(text, start)
+    if speaker is None:
+        return "", "", start
+    return speaker[0], speaker[1], head_end
+
+
+@lru_cache(maxsize=8192)
+def _split_timestamp(timestamp: str) -> Tuple[str, str]:
+    """
+    Parses a timestamp string into date (YYYY-MM-DD) and time (HH:MM:SS).
+    Memoized: a log carries many lines per second, so most calls are hits.
+    """
+    # Fast path for the canonical "d.mm.yyyy hh:mm:ss" shape: plain slicing,
+    # no strptime. Anything unusual (days past 28, 1-digit hours, etc.)
+    # falls through to strptime so validation stays identical.
+    i1 = timestamp.find(".")
+    i2 = timestamp.find(".", i1 + 1)
+    if (
+        0 < i1 < 3
+        and 1 < i2 - i1 < 4
+        and len(timestamp) == i2 + 14
+        and timestamp[i2 + 5] == " "
+        and timestamp[i2 + 8] == ":"
+        and timestamp[i2 + 11] == ":"
+    ):
+        day = timestamp[:i1]
+        month = timestamp[i1 + 1:i2]
+        year = timestamp[i2 + 1:i2 + 5]
+        time_str = timestamp[i2 + 6:]
+        digits = day + month + year + time_str[:2] + time_str[3:5] + time_str[6:]
+        if (
+            digits.isascii()
+            and digits.isdigit()
+            and 0 < int(day) < 29
+            and 0 < int(month) < 13
+            and year[0] != "0"
+            and int(time_str[:2]) < 24
+            and int(time_str[3:5]) < 60
+            and int(time_str[6:]) < 60
+        ):
+            return f"{year}-{month.zfill(2)}-{day.zfill(2)}", time_str
+
+    try:
+        dt = datetime.strptime(timestamp, "%d.%m.%Y %H:%M:%S")
+        return dt.strftime("%Y-%m-%d"), dt.strftime("%H:%M:%S")
+    except ValueError:
+        logger.warning("Failed to parse timestamp: %s", timestamp)
+        return "", ""
+
+
 class LogFormatter:
     """Parses and formats log lines into HTML or structured data."""
 
-    ACTION_COLOR_MAP: Dict[str, str] = {
-        "Czat IC": "#FFD700",  # Gold
-        "Czat OOC": "#FF8C00",  # Dark Orange
-        "Akcja /me": "#ADFF2F",  # GreenYellow
-        "Akcja /do": "#00CED1",  # DarkTurquoise
-        "Komenda": "#FF4500",  # OrangeRed
-        "PW": "#DA70D6",  # Orchid
-        "default": "#FFFFFF",  # Fallback
-    }
-
-    LOG_PATTERN = re.compile(
-        r"^\[(?P<timestamp>[^\]]+)\]\s+\[(?P<action>[^\]]+)\]\s+(?P<message>.*)$"
-    )
-
-    NAME_PATTERN = re.compile(
-        r"^(?P<name>[A-ZĄĆĘŁŃÓŚŹŻ][\w\s\-\']+?)\s+"
-        r"(?P<tone>mówi|szepcze|krzyczy)"
-        r"(?:\s*\((?P<extra>[^)]+)\))?"  # e.g., (radio)
-        r"(?:\s+do\s+[A-ZĄĆĘŁŃÓŚŹŻ][\w\s\-\']+?)?:\s*"
-    )
-
-    def parse_line(self, line: str):
+    ACTION_COLOR_MAP = ACTION_COLOR_MAP
+
+    LOG_PATTERN = _LOG_PATTERN
+    NAME_PATTERN = _NAME_PATTERN
+    SPEAKER_PATTERN = _SPEAKER_PATTERN
+
+    def __init__(self) -> None:
+        # Action spans are rendered once per known action instead of per line
+        self._action_spans: Dict[str, str] = {
+            action: _ACTION_HTML_TEMPLATE % (color, action)
+            for action, color in self.ACTION_COLOR_MAP.items()
+        }
+
+    def _action_html(self, action: str) -> str:
+        """Returns the colored action span for `action`."""
+        span = self._action_spans.get(action)
+        if span is None:
+            span = _ACTION_HTML_TEMPLATE % (self.ACTION_COLOR_MAP["default"], _escape_html(action))
+        return span
+
+    def parse_line(self, line: str) -> Optional[Dict[str, Any]]:
         """
         Parses a single log line into structured data.
         Returns None if the format does not match LOG_PATTERN.
         """
-        match = self.LOG_PATTERN.match(line)
-        if not match:
+        header = _split_header(line)
+        if header is None:
             logger.debug("No match for LOG_PATTERN: %s", line)
-            return {}
+            return None
 
-        timestamp_str = match.group("timestamp")
-        action = match.group("action").strip()
-        message = match.group("message").strip()
+        timestamp_str, action, message_start = header
 
-        date_str, time_str = self._parse_timestamp(timestamp_str)
-        prefix, is_radio, message = self._extract_speaker_info(message)
+        date_str, time_str = _split_timestamp(timestamp_str)
+
+        prefix, extra, body_start = _split_speaker(line, message_start)
+        message = line[body_start:].strip()
+        is_radio = extra.lower() == "radio" or line.find("Kanał:", message_start) != -1
 
         return {
             "timestamp": timestamp_str,
@@ -74,55 +268,97 @@ class LogFormatter:
             "is_radio": is_radio, # noqa
         }
 
+    def speaker_name(self, line: str) -> Optional[str]:
+        """
+        Returns the speaker's name (NAME_PATTERN's "name" group) for a log
+        line, or None if the line has no speaker prefix. Same answer as
+        matching NAME_PATTERN against parse_line's prefix, without building
+        the parsed dict or parsing the timestamp.
+        """
+        header = _split_header(line)
+        if header is None:
+            return None
+        speaker, _ = _find_speaker(line, header[2])
+        return speaker[2] if speaker else None
+
     def _parse_timestamp(self, timestamp: str) -> Tuple[str, str]:
         """
         Parses a timestamp string into date (YYYY-MM-DD) and time (HH:MM:SS).
         Returns empty strings if parsing fails.
         """
-        try:
-            dt = datetime.strptime(timestamp, "%d.%m.%Y %H:%M:%S")
-            return dt.strftime("%Y-%m-%d"), dt.strftime("%H:%M:%S")
-        except ValueError:
-            logger.warning("Failed to parse timestamp: %s", timestamp)
-            return "", ""
+        return _split_timestamp(timestamp)
 
     def _extract_speaker_info(self, message: str) -> Tuple[str, bool, str]:
         """
         Extracts speaker prefix from the message and detects if it's a radio call.
         Returns (prefix, is_radio, new_message).
         """
-        match = self.NAME_PATTERN.match(message)
-        if not match:
+        prefix, extra, _ = _split_speaker(message, 0)
+        if not prefix:
             if "Kanał:" in message:
                 return "", True, message
             return "", False, message
-        prefix = match.group(0).strip()
-        extra = match.group("extra") or ""
         is_radio = extra.lower() == "radio" or "Kanał:" in message
         new_message = message[len(prefix):].strip()  # noqa
         return prefix, is_radio, new_message
 
     def format_line(self, line: str, index: int) -> str:
         """
-        Formats a single log line into an HTML snippet with syntax highlighting.
-        Returns a <pre> block if parsing fails.
+        Formats a single log line into an HTML snippet with syntax highlighting,
+        with the log text HTML-escaped. Returns a <pre> block if parsing fails.
         """
         parsed = self.parse_line(line)
         if not parsed:
             logger.debug("Line %d unrecognized format: %s", index, line)
-            return f"<pre>{index}: {line}</pre>"
+            return f"<pre>{index}: {_escape_html(line)}</pre>"
 
-        timestamp_color = "#00BFFF"
-        action_color = self.ACTION_COLOR_MAP.get(
-            parsed["action"], self.ACTION_COLOR_MAP["default"]
-        )
-        prefix_color = "#FFFFFF"
-        message_color = "#CCCCCC"
-
-        return (
-            f'<span style="color: #AAAAAA; font-weight: bold;">[{index}]</span> '
-            f'<span style="color: {timestamp_color}; font-weight: bold;">[{parsed["timestamp"]}]</span> '
-            f'<span style="color: {action_color}; font-weight: bold;">[{parsed["action"]}]</span> '
-            f'<span style="color: {prefix_color}; font-weight: bold;">{parsed["prefix"]} </span>'
-            f'<span style="color: {message_color};">{parsed["message"]}</span>'
+        return _LINE_HTML_TEMPLATE % (
+            index,
+            _escape_html(parsed["timestamp"]),
+            self._action_html(parsed["action"]),
+            _escape_html(parsed["prefix"]),
+            _escape_html(parsed["message"]),
         )
+
+    def format_lines(self, lines: Iterable[str], start: int = 1) -> List[str]:
+        """
+        Formats many log lines at once, numbering them from `start`.
+        Same output as calling format_line per line, with the per-line
+        attribute lookups hoisted out of the loop.
+        """
+        return list(self._iter_formatted(lines, start))
+
+    def format_into(
+        self, out: TextIO, lines: Iterable[str], start: int = 1, separator: str = "\n"
+    ) -> None:
+        """
+        Writes formatted lines straight to a text stream (an io.StringIO,
+        an open file), each followed by `separator`, without building a
+        list of the whole batch first.
+        """
+        write = out.write
+        for row_html in self._iter_formatted(lines, start):
+            write(row_html)
+            write(separator)
+
+    def _iter_formatted(self, lines: Iterable[str], start: int) -> Iterator[str]:
+        """Yields format_line output for each line, numbered from `start`."""
+        parse = self.parse_line
+        span_get = self._action_spans.get
+        action_html = self._action_html
+        template = _LINE_HTML_TEMPLATE
+        escape = _escape_html
+
+        for index, line in enumerate(lines, start):
+            parsed = parse(line)
+            if not parsed:
+                yield f"<pre>{index}: {escape(line)}</pre>"
+                continue
+            action = parsed["action"]
+            yield template % (
+                index,
+                escape(parsed["timestamp"]),
+                span_get(action) or action_html(action),
+                escape(parsed["prefix"]),
+                escape(parsed["message"]),
+            )
@@ -5,7 +5,6 @@ Loads raw log lines from a file, extracts unique users, and provides sorted logs
 """
 
 import os
-import re
 import logging
 from typing import List, Set, Dict
 
@@ -17,7 +16,8 @@ class LogParser:
     Parses a log file, storing all lines and detecting unique users by pattern.
     """
 
-    USER_PATTERN = re.compile(r"([\w\s\-]+?)\s+mówi(?:\s+\(([^)]+)\))?:")
+    # Speech marker; any whitespace separates it from the speaker's name
+    USER_MARKER = "mówi"
 
     def __init__(self, file_path: str) -> None:
         """
@@ -33,23 +33,77 @@ class LogParser:
     def _load_logs(self) -> None:
         """Loads logs from the file and extracts unique users."""
         if not os.path.isfile(self.file_path):
-            logger.error(f"File not found: {self.file_path}")
+            logger.error("File not found: %s", self.file_path)
             raise FileNotFoundError(f"File not found: {self.file_path}")
 
         try:
             with open(self.file_path, "r", encoding="utf-8") as file:
-                for line in file:
-                    self.logs.append(line.strip())
-                    self._extract_user(line)
+                data = file.read()
         except OSError as e:
-            logger.error(f"Error loading file {self.file_path}: {e}")
+            logger.error("Error loading file %s: %s", self.file_path, e)
             raise
 
-    def _extract_user(self, line: str) -> None:
-        """Extracts unique users from a line based on USER_PATTERN."""
-        match = self.USER_PATTERN.search(line)
-        if match:
-            self.users.add(match.group(1))
+        lines = data.split("\n")
+        if not lines[-1]:
+            lines.pop()  # trailing newline, not an extra empty line
+        self.logs = [line.strip() for line in lines]
+        self.users = self._extract_users(data)
+
+    def _extract_users(self, data: str) -> Set[str]:
+        """
+        Collects speaker names from a whole file buffer. The first "mówi:"
+        or "mówi (...):" marker of each line, preceded by any whitespace,
+        names the run of word characters, spaces and hyphens before it,
+        trimmed of surrounding whitespace. Later markers on the same line
+        (e.g. quoted speech) are ignored.
+        """
+        users: Set[str] = set()
+        find = data.find
+        size = len(data)
+        marker_len = len(self.USER_MARKER)
+
+        pos = find(self.USER_MARKER)
+        while pos != -1:
+            after = pos + marker_len
+
+            # At least one whitespace character on the line before the marker
+            name_end = pos
+            while name_end > 0 and data[name_end - 1] != "\n" and data[name_end - 1].isspace():
+                name_end -= 1
+
+            # Then ":" right after it, or whitespace, "(...)" and ":"
+            paren = after
+            while paren < size and data[paren] != "\n" and data[paren].isspace():
+                paren += 1
+            if paren > after and data.startswith("(", paren):
+                close = find(")", paren + 1)
+                is_speech = (
+                    close > paren + 1
+                    and find("\n", paren + 1, close) == -1
+                    and data.startswith(":", close + 1)
+                )
+            else:
+                is_speech = data.startswith(":", after)
+
+            if is_speech and name_end < pos:
+                start = name_end
+                while start > 0:
+                    char = data[start - 1]
+                    if char.isalnum() or char in "_-" or (char.isspace() and char != "\n"):
+                        start -= 1
+                    else:
+                        break
+                name = data[start:name_end].strip()
+                if name:
+                    users.add(name)
+                    # Only the line's first speaker counts; go on from the next line
+                    line_end = find("\n", after)
+                    if line_end == -1:
+                        break
+                    pos = find(self.USER_MARKER, line_end + 1)
+                    continue
+            pos = find(self.USER_MARKER, after)
+        return users
 
     def get_sorted_logs(self, ascending: bool = True) -> List[str]:
         """
@@ -3,16 +3,17 @@ left_panel.py
 
 Handles:
 - Logo and 'Load Logs' button
-- QGroupBox for Interviewer and Interrogated (with scroll areas)
+- QGroupBox for Interviewer and Interrogated (checkable QListWidgets)
 - 'Show only related' checkbox
 - Disables selection of the same person in both groups
-- Emits logsLoaded(List[str]) and namesUpdated(...) signals
+- Emits logsLoaded(List[str], List[Optional[dict]]) and namesUpdated(...) signals
+- Reads and parses loaded files on a QThreadPool worker, off the GUI thread
 """
 
 import os
 import logging
-from functools import partial
-from typing import List, Dict
+from collections import Counter
+from typing import List, Dict, Optional, Tuple
 
 from PyQt6.QtWidgets import (
     QWidget,
@@ -22,16 +23,67 @@ from PyQt6.QtWidgets import (
     QGroupBox,
     QCheckBox,
     QFileDialog,
-    QScrollArea,
+    QListWidget,
+    QListWidgetItem,
+    QProgressBar,
 )
 from PyQt6.QtGui import QPixmap
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import Qt, pyqtSignal, QObject, QRunnable, QThreadPool, QTimer
 
 from src.models.log_parser import LogParser
 from src.models.log_formatter import LogFormatter
 
 logger = logging.getLogger(__name__)
 
+# Shared by every load instead of being re-created per call
+_FORMATTER = LogFormatter()
+
+_LOGO_PATH = os.path.normpath(
+    os.path.join(os.path.dirname(__file__), "..", "..", "resources", "lssd_logo_bar.png")
+)
+
+_NAME_ITEM_FLAGS = Qt.ItemFlag.ItemIsUserCheckable | Qt.ItemFlag.ItemIsEnabled
+
+
+def _count_speakers(logs: List[str]) -> List[Tuple[str, int]]:
+    """
+    Returns (raw_name, count) for every speaker in logs, most frequent first.
+    LogFormatter.speaker_name, a Python method, still runs once per line; only
+    the counting itself is done by Counter in C. most_common keeps first-seen
+    order for ties.
+    """
+    return Counter(filter(None, map(_FORMATTER.speaker_name, logs))).most_common()
+
+
+class _LogLoadSignals(QObject):
+    """Signals of _LogLoadWorker (a QRunnable cannot declare its own)."""
+
+    loaded = pyqtSignal(list, list, list)  # Emits raw logs, parsed logs, [(raw_name, count)]
+    failed = pyqtSignal(str)  # Emits the error message
+
+
+class _LogLoadWorker(QRunnable):
+    """
+    Reads a log file, parses every line and counts its speakers on a pool
+    thread, so only widget creation and rendering are left for the GUI thread.
+    """
+
+    def __init__(self, file_path: str) -> None:
+        super().__init__()
+        self.file_path = file_path
+        self.signals = _LogLoadSignals()
+
+    def run(self) -> None:
+        # Any failure must reach the GUI thread, or loading is never re-enabled
+        try:
+            logs = LogParser(self.file_path).logs
+            parsed = list(map(_FORMATTER.parse_line, logs))
+            sorted_names = _count_speakers(logs)
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+            return
+        self.signals.loaded.emit(logs, parsed, sorted_names)
+
 
 class LeftPanel(QWidget):
     """
@@ -41,16 +93,19 @@ class LeftPanel(QWidget):
       - Interviewer/Interrogated selection (with mutual exclusion)
       - 'Show only related' checkbox
     Emits:
-      - logsLoaded(List[str]): once logs are loaded
+      - logsLoaded(List[str], List[Optional[dict]]): once logs are loaded,
+        with the raw lines and their LogFormatter.parse_line results
       - namesUpdated(List[str], List[str], bool):
         * ordered list of interviewers, ordered list of interrogated, and show_only_related flag
     """
 
-    logsLoaded = pyqtSignal(list)  # Emits raw log list
+    logsLoaded = pyqtSignal(list, list)  # Emits raw log list, parsed log list
     namesUpdated = pyqtSignal(
         list, list, bool
     )  # Emits updated interviewers/interrogated lists
 
+    _LOGO_PIXMAP: Optional[QPixmap] = None
+
     def __init__(self, parent=None) -> None:
         super().__init__(parent)
         self.setObjectName("leftPanel")
@@ -58,71 +113,88 @@ class LeftPanel(QWidget):
         self.raw_logs: List[str] = []
 
         # Track selected interviewers/interrogated
-        self._interviewer_order: List[str] = []
-        self._interrogated_order: List[str] = []
+        # Insertion-ordered dicts used as ordered sets (values unused)
+        self._interviewer_order: Dict[str, None] = {}
+        self._interrogated_order: Dict[str, None] = {}
 
-        # Dicts from raw_name -> QCheckBox
-        self.interviewer_checkboxes: Dict[str, QCheckBox] = {}
-        self.interrogated_checkboxes: Dict[str, QCheckBox] = {}
+        # Dicts from raw_name -> checkable list item
+        self.interviewer_items: Dict[str, QListWidgetItem] = {}
+        self.interrogated_items: Dict[str, QListWidgetItem] = {}
 
         # UI elements
         self.logo_label = QLabel(self)
         self.load_button = QPushButton("📂 Load Logs", self)
 
+        # Busy indicator shown while a file is parsed in the background
+        self.load_progress = QProgressBar(self)
+        self.load_progress.setRange(0, 0)
+        self.load_progress.setTextVisible(False)
+        self.load_progress.setVisible(False)
+        self._load_worker: Optional[_LogLoadWorker] = None
+
+        # (path, size, mtime) of the loaded file and of the one being loaded
+        self._loaded_key: Optional[Tuple[str, int, float]] = None
+        self._pending_key: Optional[Tuple[str, int, float]] = None
+
+        # One list widget per group: items are painted by a single delegate,
+        # only for visible rows, instead of one QCheckBox widget per name
         self.interviewer_group = QGroupBox("Interviewer/LEA [I]", self)
+        self.interviewer_list = QListWidget(self.interviewer_group)
         self.interviewer_layout = QVBoxLayout()
+        self.interviewer_layout.addWidget(self.interviewer_list)
         self.interviewer_group.setLayout(self.interviewer_layout)
 
         self.interrogated_group = QGroupBox("Interrogated/POI [O]", self)
+        self.interrogated_list = QListWidget(self.interrogated_group)
         self.interrogated_layout = QVBoxLayout()
+        self.interrogated_layout.addWidget(self.interrogated_list)
         self.interrogated_group.setLayout(self.interrogated_layout)
 
         self.show_only_related_checkbox = QCheckBox("Show only related", self)
 
+        # Coalesces namesUpdated emissions, see _emit_names_updated
+        self._emit_timer = QTimer(self)
+        self._emit_timer.setSingleShot(True)
+        self._emit_timer.setInterval(0)
+        self._emit_timer.timeout.connect(self._do_emit_names_updated)
+
         self._init_ui()
         self._connect_signals()
 
     def _init_ui(self) -> None:
         """
         Sets up layout: logo, load button, group boxes, 'Show only related'.
-        Wraps group boxes in scroll areas.
         """
-        # Logo
-        logo_path = os.path.join(
-            os.path.dirname(__file__), "../../resources/lssd_logo_bar.png"
-        )
-        pixmap = QPixmap(logo_path).scaled(300, 60, Qt.AspectRatioMode.KeepAspectRatio)
-        self.logo_label.setPixmap(pixmap)
+        # Logo, decoded and scaled once per process
+        if LeftPanel._LOGO_PIXMAP is None:
+            LeftPanel._LOGO_PIXMAP = QPixmap(_LOGO_PATH).scaled(
+                300, 60, Qt.AspectRatioMode.KeepAspectRatio
+            )
+        self.logo_label.setPixmap(LeftPanel._LOGO_PIXMAP)
         self.logo_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
 
-        # Create scroll areas for each group
-        interviewer_scroll = QScrollArea(self)
-        interviewer_scroll.setWidget(self.interviewer_group)
-        interviewer_scroll.setWidgetResizable(True)
-
-        interrogated_scroll = QScrollArea(self)
-        interrogated_scroll.setWidget(self.interrogated_group)
-        interrogated_scroll.setWidgetResizable(True)
-
         layout = QVBoxLayout(self)
         layout.addWidget(self.logo_label)
         layout.addWidget(self.load_button)
-        layout.addWidget(interviewer_scroll)
-        layout.addWidget(interrogated_scroll)
+        layout.addWidget(self.load_progress)
+        layout.addWidget(self.interviewer_group)
+        layout.addWidget(self.interrogated_group)
         layout.addWidget(self.show_only_related_checkbox)
         layout.addStretch()
         self.setLayout(layout)
 
     def _connect_signals(self) -> None:
         """
-        Connect button clicks and checkbox signals to internal slots.
+        Connect button clicks, list item and checkbox signals to internal slots.
         """
         self.load_button.clicked.connect(self._on_load_clicked)
+        self.interviewer_list.itemChanged.connect(self._on_interviewer_changed)
+        self.interrogated_list.itemChanged.connect(self._on_interrogated_changed)
         self.show_only_related_checkbox.stateChanged.connect(self._emit_names_updated)
 
     def _on_load_clicked(self) -> None:
         """
-        Opens a file dialog to load logs. Emits logsLoaded, then populates name selections.
+        Opens a file dialog to load logs and starts loading the chosen file.
         """
         file_path, _ = QFileDialog.getOpenFileName(
             self, "Open Log File", "", "Text Files (*.txt)"
@@ -131,137 +203,200 @@ class LeftPanel(QWidget):
             logger.info("No file selected.")
             return
 
-        if file_path:
-            logger.info("📂 Loaded file: %s", file_path)
-            parser = LogParser(file_path)
-            self.raw_logs = parser.logs
-            self.logsLoaded.emit(self.raw_logs)
-            self._populate_name_selections()
+        self.load_file(file_path)
 
-    def _populate_name_selections(self) -> None:
+    def load_file(self, file_path: str) -> None:
         """
-        Creates checkboxes for each discovered name in logs, sorted by frequency.
+        Parses file_path on the global thread pool. Once done, emits
+        logsLoaded and populates name selections on the GUI thread.
+        Reloading the file that is already shown, unchanged, is a no-op,
+        and so is any call made while a previous load is still running.
         """
-        # Clear old checkboxes
-        for layout in (self.interviewer_layout, self.interrogated_layout):
-            while layout.count():
-                item = layout.takeAt(0)
-                widget = item.widget()
-                if widget:
-                    widget.deleteLater()
-
-        self.interviewer_checkboxes.clear()
-        self.interrogated_checkboxes.clear()
-        self._interviewer_order.clear()
-        self._interrogated_order.clear()
-
-        freq: Dict[str, int] = {}
-        formatter = LogFormatter()
-        for line in self.raw_logs:
-            parsed = formatter.parse_line(line)
-            if parsed and parsed.get("prefix"):
-                match = formatter.NAME_PATTERN.match(parsed["prefix"])
-                if match:
-                    raw_name = match.group("name")
-                    freq[raw_name] = freq.get(raw_name, 0) + 1
-
-        # Sort names by frequency
-        sorted_names = sorted(freq.items(), key=lambda x: -x[1])
-        for raw_name, count in sorted_names:
-            display_text = f"{raw_name} ({count})"
-            cb_i = QCheckBox(display_text, self)
-            cb_o = QCheckBox(display_text, self)
-
-            # Connect with the raw_name
-            cb_i.stateChanged.connect(
-                partial(self._on_interviewer_changed, display_text)
-            )
-            cb_o.stateChanged.connect(
-                partial(self._on_interrogated_changed, display_text)
+        if self._load_worker is not None:
+            logger.warning("📂 A file is still loading, ignoring: %s", file_path)
+            return
+        try:
+            stat = os.stat(file_path)
+            key: Optional[Tuple[str, int, float]] = (
+                os.path.realpath(file_path),
+                stat.st_size,
+                stat.st_mtime,
             )
+        except OSError:
+            key = None  # Let the worker report the error
+        if key is not None and key == self._loaded_key:
+            logger.info("📂 File unchanged since last load, skipping: %s", file_path)
+            return
+        self._pending_key = key
+
+        logger.info("📂 Loading file: %s", file_path)
+        worker = _LogLoadWorker(file_path)
+        # Emitted from a pool thread: always deliver through the GUI event loop.
+        # PyQt6 accepts a connection type here, but its stubs omit the argument.
+        worker.signals.loaded.connect(
+            self._on_logs_ready, Qt.ConnectionType.QueuedConnection  # type: ignore[call-arg]
+        )
+        worker.signals.failed.connect(
+            self._on_load_failed, Qt.ConnectionType.QueuedConnection  # type: ignore[call-arg]
+        )
+        # Keep the Python side (and its signals) alive until the worker reports back
+        self._load_worker = worker
+
+        self.load_button.setEnabled(False)
+        self.load_progress.setVisible(True)
+        pool = QThreadPool.globalInstance()
+        assert pool is not None  # Qt creates the global pool on first use
+        pool.start(worker)
+
+    def _on_logs_ready(
+        self, logs: List[str], parsed: List[Optional[dict]], sorted_names: List[Tuple[str, int]]
+    ) -> None:
+        """
+        Receives a finished background load: emits logsLoaded, then builds name selections.
+        """
+        self._finish_loading()
+        self._loaded_key = self._pending_key
+        self._pending_key = None
+        logger.info("📂 Loaded %d lines", len(logs))
+        self.raw_logs = logs
+        self.logsLoaded.emit(self.raw_logs, parsed)
+        self._build_name_selections(sorted_names)
+
+    def _on_load_failed(self, message: str) -> None:
+        """
+        Receives a failed background load; the current logs stay as they are.
+        """
+        self._finish_loading()
+        self._pending_key = None
+        logger.error("Loading logs failed: %s", message)
+
+    def _finish_loading(self) -> None:
+        """Hides the busy indicator and re-enables loading."""
+        self._load_worker = None
+        self.load_progress.setVisible(False)
+        self.load_button.setEnabled(True)
 
-            # Add to group layouts
-            self.interviewer_layout.addWidget(cb_i)
-            self.interrogated_layout.addWidget(cb_o)
+    def _build_name_selections(self, sorted_names: List[Tuple[str, int]]) -> None:
+        """
+        Fills both lists with a checkable item per (raw_name, count) in
+        sorted_names, in order, replacing the previous load's items.
+        """
+        self.interviewer_items.clear()
+        self.interrogated_items.clear()
+        self._interviewer_order.clear()
+        self._interrogated_order.clear()
 
-            # Store references
-            self.interviewer_checkboxes[raw_name] = cb_i
-            self.interrogated_checkboxes[raw_name] = cb_o
+        display_texts = [f"{raw_name} ({count})" for raw_name, count in sorted_names]
+        for name_list, items in (
+            (self.interviewer_list, self.interviewer_items),
+            (self.interrogated_list, self.interrogated_items),
+        ):
+            # Filled silently and repainted once, even if filling fails midway
+            name_list.blockSignals(True)
+            name_list.setUpdatesEnabled(False)
+            try:
+                name_list.clear()
+                for (raw_name, _), display_text in zip(sorted_names, display_texts):
+                    item = QListWidgetItem(display_text, name_list)
+                    item.setFlags(_NAME_ITEM_FLAGS)
+                    item.setCheckState(Qt.CheckState.Unchecked)
+                    item.setData(Qt.ItemDataRole.UserRole, raw_name)
+                    items[raw_name] = item
+            finally:
+                name_list.setUpdatesEnabled(True)
+                name_list.blockSignals(False)
 
         # Emit updated names
         self._emit_names_updated()
 
-    def _on_interviewer_changed(self, raw_display_text: str, state: int) -> None:
+    def _on_interviewer_changed(self, item: QListWidgetItem) -> None:
         """
-        Handles checking/unchecking of Interviewer checkboxes.
+        Handles checking/unchecking of Interviewer items.
         Ensures the same name is disabled in Interrogated.
         """
-        raw_name = raw_display_text.split(" (")[0]  # Remove frequency count
+        raw_name = item.data(Qt.ItemDataRole.UserRole)
+        is_checked = item.checkState() == Qt.CheckState.Checked
+        if is_checked == (raw_name in self._interviewer_order):
+            return  # itemChanged also fires for text and flag changes
 
-        # Ensure correct checkbox state
-        is_checked = state == Qt.CheckState.Checked.value
-        logger.debug(
-            f"🟢 Interviewer Checkbox Clicked -> {raw_name}, State: {state}, is_checked: {is_checked}"
-        )
+        logger.debug("🟢 Interviewer Item Clicked -> %s, is_checked: %s", raw_name, is_checked)
 
         if is_checked:
-            if raw_name not in self._interviewer_order:
-                self._interviewer_order.append(raw_name)
-                logger.debug(f"✅ Added to Interviewers: {raw_name}")
-
-            # Disable in Interrogated
-            if raw_name in self.interrogated_checkboxes:
-                self.interrogated_checkboxes[raw_name].setChecked(False)
-                self.interrogated_checkboxes[raw_name].setEnabled(False)
-                logger.debug(f"🚫 Disabled '{raw_name}' in Interrogated")
+            self._interviewer_order[raw_name] = None
+            logger.debug("✅ Added to Interviewers: %s", raw_name)
+
+            # Disable in Interrogated; signals blocked, so its slot does not run
+            if raw_name in self.interrogated_items:
+                other = self.interrogated_items[raw_name]
+                self.interrogated_list.blockSignals(True)
+                other.setCheckState(Qt.CheckState.Unchecked)
+                other.setFlags(other.flags() & ~Qt.ItemFlag.ItemIsEnabled)
+                self.interrogated_list.blockSignals(False)
+                self._interrogated_order.pop(raw_name, None)
+                logger.debug("🚫 Disabled '%s' in Interrogated", raw_name)
         else:
-            if raw_name in self._interviewer_order:
-                self._interviewer_order.remove(raw_name)
-                logger.debug(f"❌ Removed from Interviewers: {raw_name}")
+            del self._interviewer_order[raw_name]
+            logger.debug("❌ Removed from Interviewers: %s", raw_name)
 
-            # Re-enable in Interrogated (only if it wasn't manually disabled)
-            if raw_name in self.interrogated_checkboxes:
-                self.interrogated_checkboxes[raw_name].setEnabled(True)
-                logger.debug(f"🔓 Re-enabled '{raw_name}' in Interrogated")
+            # Re-enable in Interrogated
+            if raw_name in self.interrogated_items:
+                other = self.interrogated_items[raw_name]
+                self.interrogated_list.blockSignals(True)
+                other.setFlags(other.flags() | Qt.ItemFlag.ItemIsEnabled)
+                self.interrogated_list.blockSignals(False)
+                logger.debug("🔓 Re-enabled '%s' in Interrogated", raw_name)
 
         self._emit_names_updated()
 
-    def _on_interrogated_changed(self, raw_display_text: str, state: int) -> None:
+    def _on_interrogated_changed(self, item: QListWidgetItem) -> None:
         """
-        Handles checking/unchecking of Interrogated checkboxes.
+        Handles checking/unchecking of Interrogated items.
         Ensures the same name is disabled in Interviewer.
         """
-        raw_name = raw_display_text.split(" (")[0]  # Remove frequency count
+        raw_name = item.data(Qt.ItemDataRole.UserRole)
+        is_checked = item.checkState() == Qt.CheckState.Checked
+        if is_checked == (raw_name in self._interrogated_order):
+            return  # itemChanged also fires for text and flag changes
 
-        # Ensure correct checkbox state
-        is_checked = state == Qt.CheckState.Checked.value
-        logger.debug(
-            f"🔴 Interrogated Checkbox Clicked -> {raw_name}, State: {state}, is_checked: {is_checked}"
-        )
+        logger.debug("🔴 Interrogated Item Clicked -> %s, is_checked: %s", raw_name, is_checked)
 
         if is_checked:
-            if raw_name not in self._interrogated_order:
-                self._interrogated_order.append(raw_name)
-                logger.debug(f"✅ Added to Interrogated: {raw_name}")
-
-            # Disable in Interviewer
-            if raw_name in self.interviewer_checkboxes:
-                self.interviewer_checkboxes[raw_name].setChecked(False)
-                self.interviewer_checkboxes[raw_name].setEnabled(False)
-                logger.debug(f"🚫 Disabled '{raw_name}' in Interviewer")
+            self._interrogated_order[raw_name] = None
+            logger.debug("✅ Added to Interrogated: %s", raw_name)
+
+            # Disable in Interviewer; signals blocked, so its slot does not run
+            if raw_name in self.interviewer_items:
+                other = self.interviewer_items[raw_name]
+                self.interviewer_list.blockSignals(True)
+                other.setCheckState(Qt.CheckState.Unchecked)
+                other.setFlags(other.flags() & ~Qt.ItemFlag.ItemIsEnabled)
+                self.interviewer_list.blockSignals(False)
+                self._interviewer_order.pop(raw_name, None)
+                logger.debug("🚫 Disabled '%s' in Interviewer", raw_name)
         else:
-            if raw_name in self._interrogated_order:
-                self._interrogated_order.remove(raw_name)
-                logger.debug(f"❌ Removed from Interrogated: {raw_name}")
+            del self._interrogated_order[raw_name]
+            logger.debug("❌ Removed from Interrogated: %s", raw_name)
 
-            # Re-enable in Interviewer (only if it wasn't manually disabled)
-            if raw_name in self.interviewer_checkboxes:
-                self.interviewer_checkboxes[raw_name].setEnabled(True)
-                logger.debug(f"🔓 Re-enabled '{raw_name}' in Interviewer")
+            # Re-enable in Interviewer
+            if raw_name in self.interviewer_items:
+                other = self.interviewer_items[raw_name]
+                self.interviewer_list.blockSignals(True)
+                other.setFlags(other.flags() | Qt.ItemFlag.ItemIsEnabled)
+                self.interviewer_list.blockSignals(False)
+                logger.debug("🔓 Re-enabled '%s' in Interviewer", raw_name)
 
         self._emit_names_updated()
 
     def _emit_names_updated(self) -> None:
+        """
+        Schedules a namesUpdated emission for the next event loop pass.
+        Changes made in the same pass (a toggle plus the cross-group
+        disable it causes, a reload) are emitted once.
+        """
+        if not self._emit_timer.isActive():
+            self._emit_timer.start()
+
+    def _do_emit_names_updated(self) -> None:
         """
         Emits the ordered Interviewers, ordered Interrogated, and
         whether 'Show only related' is checked.
@@ -10,8 +10,8 @@ Contains:
 
 import logging
 from functools import partial
-from typing import List, Dict
-from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton
+from typing import List, Dict, Optional
+from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QButtonGroup, QSpinBox
 from PyQt6.QtGui import QFont
 from PyQt6.QtCore import pyqtSignal
 
@@ -57,6 +57,12 @@ class RightPanel(QWidget):
         self._order_label = QLabel("Logs order", self)
         self._asc_button = QPushButton("ASC ⬆")
         self._desc_button = QPushButton("DESC ⬇")
+        # Keeps exactly one of ASC/DESC checked
+        self._order_group = QButtonGroup(self)
+
+        # Caps how many lines the workspace shows; 0 ("All") shows every line
+        self._max_lines_label = QLabel("Max lines", self)
+        self._max_lines_spin = QSpinBox(self)
 
         self.workspace = Workspace()
 
@@ -73,12 +79,23 @@ class RightPanel(QWidget):
         self._asc_button.setCheckable(True)
         self._desc_button.setCheckable(True)
         self._asc_button.setChecked(True)  # Default is ASC order
+        self._order_group.setExclusive(True)
+        self._order_group.addButton(self._asc_button)
+        self._order_group.addButton(self._desc_button)
+
+        self._max_lines_label.setFont(QFont("Arial", 12))
+        self._max_lines_label.setStyleSheet("color: #FFD700;")
+        self._max_lines_spin.setRange(0, 1_000_000)
+        self._max_lines_spin.setSingleStep(1000)
+        self._max_lines_spin.setSpecialValueText("All")
 
         order_layout = QHBoxLayout()
         order_layout.addWidget(self._order_label)
         order_layout.addWidget(self._asc_button)
         order_layout.addWidget(self._desc_button)
         order_layout.addStretch()
+        order_layout.addWidget(self._max_lines_label)
+        order_layout.addWidget(self._max_lines_spin)
 
         filter_layout = QHBoxLayout()
         for name in self._toggle_names:
@@ -101,6 +118,7 @@ class RightPanel(QWidget):
         """
         self._asc_button.clicked.connect(self._on_asc_clicked)
         self._desc_button.clicked.connect(self._on_desc_clicked)
+        self._max_lines_spin.valueChanged.connect(self.workspace.set_max_lines)
 
         # Connect each toggle button with its handler
         for name, btn in self._toggles.items():
@@ -112,8 +130,7 @@ class RightPanel(QWidget):
         """Set order to ASC and emit signal."""
         if self._sort_order != "ASC":
             self._sort_order = "ASC"
-            self._asc_button.setChecked(True)
-            self._desc_button.setChecked(False)
+            self._asc_button.setChecked(True)  # The group unchecks DESC
             self.orderChanged.emit("ASC")
             self.workspace.on_order_changed("ASC")
 
@@ -121,8 +138,7 @@ class RightPanel(QWidget):
         """Set order to DESC and emit signal."""
         if self._sort_order != "DESC":
             self._sort_order = "DESC"
-            self._asc_button.setChecked(False)
-            self._desc_button.setChecked(True)
+            self._desc_button.setChecked(True)  # The group unchecks ASC
             self.orderChanged.emit("DESC")
             self.workspace.on_order_changed("DESC")
 
@@ -133,18 +149,19 @@ class RightPanel(QWidget):
         Emit current states of all toggles whenever any single toggle changes.
         """
         states = {name: btn.isChecked() for name, btn in self._toggles.items()}
-        logger.debug(f"🔄 Toggle Updated -> {toggle_name}: {checked}")
+        logger.debug("🔄 Toggle Updated -> %s: %s", toggle_name, checked)
         self.filterTogglesUpdated.emit(states)
         self.workspace.on_filter_toggles_updated(states)
 
     # -------------------- EXTERNAL INTERFACE --------------------
 
-    def on_logs_loaded(self, logs: List[str]) -> None:
+    def on_logs_loaded(self, logs: List[str], parsed: Optional[List[Optional[dict]]] = None) -> None:
         """
-        Called by MainWindow/LeftPanel when logs are loaded.
+        Called by MainWindow/LeftPanel when logs are loaded, optionally with
+        their already parsed lines.
         Enables toggles, sets logs in the workspace, triggers an update.
         """
-        logger.debug(f"📂 Logs Loaded -> {len(logs)} entries")
+        logger.debug("📂 Logs Loaded -> %d entries", len(logs))
         self._raw_logs = logs
         for btn in self._toggles.values():
             if not btn.isEnabled():
@@ -155,7 +172,7 @@ class RightPanel(QWidget):
             self._toggles[name].setChecked(True)
 
         # Let the workspace know about the logs
-        self.workspace.set_raw_logs(logs)
+        self.workspace.set_raw_logs(logs, parsed)
         self.workspace.update_view()
 
     def on_names_updated(
@@ -167,7 +184,7 @@ class RightPanel(QWidget):
         We pass these to the Workspace, then update_view.
         """
         logger.debug(
-            f"📝 Names Updated -> [I]: {interviewers}, [O]: {interrogated}, OnlyRelated: {show_related}"
+            "📝 Names Updated -> [I]: %s, [O]: %s, OnlyRelated: %s", interviewers, interrogated, show_related
         )
         self.workspace.set_selected_names(interviewers, interrogated, show_related)
         self.workspace.update_view()
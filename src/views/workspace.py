@@ -1,7 +1,7 @@
 """
 src/views/workspace.py
 
-Displays logs in an HTML table with advanced filtering logic:
+Displays logs as numbered, coloured plain-text lines with advanced filtering logic:
 - Toggles for date/hour, /me, /do, OOC, PW, radio, etc.
 - ASC/DESC order
 - Always label lines containing selected interviewers or interrogated with
@@ -10,62 +10,260 @@ Displays logs in an HTML table with advanced filtering logic:
 """
 
 import re
+import html
 import logging
-from typing import List, Dict, Optional
+from functools import lru_cache
+from typing import Any, List, Dict, Optional, Tuple
 
-from PyQt6.QtWidgets import QWidget, QVBoxLayout, QTextEdit
-from PyQt6.QtGui import QFont
+from PyQt6.QtWidgets import QWidget, QVBoxLayout, QPlainTextEdit
+from PyQt6.QtGui import QColor, QFont, QSyntaxHighlighter, QTextCharFormat, QTextDocument
+from PyQt6.QtCore import QTimer
 from src.models.log_formatter import LogFormatter, ACTION_COLOR_MAP
 
 logger = logging.getLogger(__name__)
 
+# Speaker of a radio line that has no speaker prefix
+_RADIO_SPEAKER_PATTERN = re.compile(r"\[Kanał: \d+\] ([A-Z][a-z]+ [A-Z][a-z]+):")
+
+_DEFAULT_ACTION_COLOR = ACTION_COLOR_MAP["default"]
+
+# RightPanel's toggle names, in the order _render unpacks their states
+_TOGGLE_NAMES = (
+    "📅 Tog date",
+    "⏰ Tog hour",
+    "🙂 Tog /me",
+    "🖼️ Tog /do",
+    "💬 Tog OOC",
+    "📩 Tog PW",
+    "🔧 Tog Commands",
+    "🕵️ Tog Unrecognized",
+    "🚔 Tog Radio",
+    "🔖 Tog Action Tags",
+)
+
+# (start, length, format) runs, relative to the start of the text they colour.
+# Counted in UTF-16 code units, as QSyntaxHighlighter.setFormat counts them.
+_Spans = Tuple[Tuple[int, int, QTextCharFormat], ...]
+# Runs of a shown line: head (timestamp, tag, action), where the body starts, body runs
+_LineRuns = Tuple[_Spans, int, _Spans]
+_NO_RUNS: _LineRuns = ((), 0, ())
+
+
+def _utf16_len(text: str) -> int:
+    """
+    Returns the length of text in UTF-16 code units, Qt's unit for text
+    positions. Characters outside the BMP (e.g. emoji) count as two.
+    """
+    if text.isascii():
+        return len(text)
+    return len(text.encode("utf-16-le")) // 2
+
+
+@lru_cache(maxsize=256)
+def _char_format(color: str, bold: bool = True) -> QTextCharFormat:
+    """
+    Returns the shared character format for a colour. Logs use a handful of
+    colours, so every row reuses the same few formats.
+    """
+    char_format = QTextCharFormat()
+    char_format.setForeground(QColor(color))
+    if bold:
+        char_format.setFontWeight(QFont.Weight.Bold)
+    return char_format
+
+
+@lru_cache(maxsize=256)
+def _action_tag(action: str) -> Tuple[str, QTextCharFormat]:
+    """
+    Returns the [action] text and its colour. Logs use a handful of
+    actions, so rows share one tag per action.
+    """
+    return f"[{html.unescape(action)}]", _char_format(ACTION_COLOR_MAP.get(action, _DEFAULT_ACTION_COLOR))
+
+
+class _LogRow:
+    """
+    One raw log line with everything the render loop reads from it,
+    derived once per load instead of on every re-render.
+    """
+
+    __slots__ = (
+        "line",
+        "parsed",
+        "action",
+        "is_radio",
+        "search_text",
+        "prefix_lower",
+        "speaker_name",
+        "timestamps",
+        "action_text",
+        "action_format",
+        "body",
+        "body_spans",
+    )
+
+    def __init__(self, line: str, parsed: Optional[Dict[str, Any]]) -> None:
+        self.line = line
+        self.parsed = parsed
+        if not parsed:
+            self.body = html.unescape(line)
+            return
+
+        action: str = parsed["action"]
+        prefix: str = parsed.get("prefix", "").strip()
+        message: str = parsed["message"].strip()
+        self.action = action
+        self.is_radio: bool = parsed.get("is_radio", False)
+
+        # Text pieces of the line; the render loop only picks and joins them.
+        # timestamps is indexed by (show_date << 1) | show_hour.
+        date = parsed.get("date", "")
+        time = parsed.get("time", "")
+        stamps = ("", time, date, f"{date} {time}" if date and time else date or time)
+        self.timestamps = tuple(f"[{stamp}]" if stamp else "" for stamp in stamps)
+        # Logs carry HTML entities (e.g. &#8594;), which are shown decoded
+        display_prefix = html.unescape(prefix)
+        display_message = html.unescape(message)
+        self.action_text, self.action_format = _action_tag(action)
+        prefix_length = _utf16_len(display_prefix)
+        message_start = prefix_length + 1 if display_prefix else 0
+        self.body = f"{display_prefix} {display_message}" if display_prefix else display_message
+        self.body_spans: _Spans = (
+            (0, prefix_length, _char_format("#FFFFFF")),
+            (message_start, _utf16_len(display_message), _char_format("#CCCCCC", bold=False)),
+        )
+
+        # Lowercased text 'Show only related' searches for selected names
+        self.search_text = f"{prefix} {message}".strip().lower()
+        self.prefix_lower = prefix.lower()
+
+        # Speaker matched against [I]/[O] selections; commands and PW get no tag
+        is_command_or_pw = (
+            message.startswith("/")
+            or message.startswith(".")
+            or message.startswith("[")
+            and not message.startswith("[.")
+        )
+        self.speaker_name = ""
+        if is_command_or_pw:
+            return
+        # Extract only the speaker's name, ignoring different speaking verbs
+        if not prefix and "[Kanał:" in message:
+            if match := _RADIO_SPEAKER_PATTERN.search(message):
+                self.speaker_name = match.group(1).lower()
+        else:
+            self.speaker_name = (
+                self.prefix_lower.replace(" mówi:", "")
+                .replace(" mówi (radio):", "")
+                .replace(" mówi (megafon):", "")
+                .replace(" mówi (krótkofalówka):", "")
+                .replace(" krzyczy:", "")
+                .replace(" szepcze:", "")
+                .strip()
+            )
+
+
+class _LogHighlighter(QSyntaxHighlighter):
+    """
+    Colours the workspace text. setPlainText has Qt call highlightBlock for
+    every block (line) of the new text before it returns, visible or not,
+    so this runs once per shown line on every render. The runs were worked
+    out when the line was built, so nothing is parsed here.
+    """
+
+    def __init__(self, document: QTextDocument) -> None:
+        super().__init__(document)
+        # Runs per block number, shifted right by `offset` (the index column)
+        self.spans: List[_LineRuns] = []
+        self.offset = 0
+
+    def highlightBlock(self, text: Optional[str]) -> None:
+        number = self.currentBlock().blockNumber()
+        if number >= len(self.spans):
+            return
+        head, body_start, body = self.spans[number]
+        offset = self.offset
+        for start, length, char_format in head:
+            self.setFormat(offset + start, length, char_format)
+        offset += body_start
+        for start, length, char_format in body:
+            self.setFormat(offset + start, length, char_format)
+
 
 class Workspace(QWidget):
     """
-    A text-based workspace that shows logs in HTML form, respecting toggles, order,
+    A text-based workspace that shows logs as coloured text lines, respecting toggles, order,
     and interviewers/interrogated selection + show-only-related logic.
     """
 
+    # Re-render requests within this window are coalesced into one render
+    RENDER_DELAY_MS = 40
+
     def __init__(self, parent: Optional[QWidget] = None) -> None:
         super().__init__(parent)
 
         self._raw_logs: List[str] = []
+        # One _LogRow per raw line, built once per load
+        self._rows: List[_LogRow] = []
         self._formatter = LogFormatter()
 
-        # Toggles from RightPanel: "Tog date", "Tog hour", etc.
-        self._toggles: Dict[str, bool] = {}
+        # Toggles from RightPanel, on/off per _TOGGLE_NAMES entry
+        self._toggle_states: Tuple[bool, ...] = (True,) * len(_TOGGLE_NAMES)
         self._order: str = "ASC"
 
         # For labeling: interviewer_order, interrogated_order
-        self._interviewer_order: List[str] = []
-        self._interrogated_order: List[str] = []
+        self._interviewer_order: Tuple[str, ...] = ()
+        self._interrogated_order: Tuple[str, ...] = ()
         self._show_only_related: bool = False
+        # Most lines shown at once, counted in display order; 0 shows all
+        self._max_lines: int = 0
+        # Inputs of the text currently shown; None forces the next render
+        self._shown_state: Optional[Tuple[Any, ...]] = None
 
         # UI
         layout = QVBoxLayout(self)
-        self._text_edit = QTextEdit()
+        self._text_edit = QPlainTextEdit()
         self._text_edit.setReadOnly(True)
         self._text_edit.setFont(QFont("Courier New", 10))
         self._text_edit.setLineWrapMode(
-            QTextEdit.LineWrapMode.NoWrap
+            QPlainTextEdit.LineWrapMode.NoWrap
         )  # horizontal scroll
         self._text_edit.setStyleSheet(
             "background-color: #0F1B29; color: #FFD700; border: 1px solid #555;"
         )
+        # Plain text is laid out without Qt's HTML parser; colours come from here
+        document = self._text_edit.document()
+        assert document is not None  # A QPlainTextEdit always owns a document
+        self._highlighter = _LogHighlighter(document)
+
+        self._render_timer = QTimer(self)
+        self._render_timer.setSingleShot(True)
+        self._render_timer.setInterval(self.RENDER_DELAY_MS)
+        self._render_timer.timeout.connect(self._render)
 
         layout.addWidget(self._text_edit)
         self.setLayout(layout)
 
     # ----- Called by RightPanel -----
 
-    def set_raw_logs(self, logs: List[str]) -> None:
-        """Store the raw logs for display."""
+    def set_raw_logs(
+        self, logs: List[str], parsed: Optional[List[Optional[Dict[str, Any]]]] = None
+    ) -> None:
+        """
+        Store the raw logs for display, with their parse_line results.
+        Lines are parsed here only if `parsed` is not given.
+        """
         self._raw_logs = logs
+        if parsed is None or len(parsed) != len(logs):
+            parsed = list(map(self._formatter.parse_line, logs))
+        self._rows = list(map(_LogRow, logs, parsed))
+        self._shown_state = None
         self.update_view()
 
     def on_filter_toggles_updated(self, toggles: Dict[str, bool]) -> None:
         """Updates filter toggles and refreshes the log view."""
-        self._toggles = toggles
+        # Resolved once per change rather than per render; missing toggles stay on
+        self._toggle_states = tuple(toggles.get(name, True) for name in _TOGGLE_NAMES)
         self.update_view()
 
     def on_order_changed(self, order: str) -> None:
@@ -73,6 +271,11 @@ class Workspace(QWidget):
         self._order = order
         self.update_view()
 
+    def set_max_lines(self, max_lines: int) -> None:
+        """Caps how many lines are shown (from the top, in display order); 0 shows all."""
+        self._max_lines = max_lines
+        self.update_view()
+
     # ----- Called by LeftPanel -> RightPanel -> This Workspace -----
 
     def set_selected_names(
@@ -85,13 +288,21 @@ class Workspace(QWidget):
         Receives the (ordered) interviewers, (ordered) interrogated,
         and whether to show only lines that contain them (if not Komenda or radio).
         """
-        self._interviewer_order = interviewer_order[:]
-        self._interrogated_order = interrogated_order[:]
+        # Immutable snapshots, also usable as-is in the shown-state key
+        self._interviewer_order = tuple(interviewer_order)
+        self._interrogated_order = tuple(interrogated_order)
         self._show_only_related = show_related
         self.update_view()
 
     # ----- Render -----
     def update_view(self) -> None:
+        """
+        Schedules a re-render. Each call restarts the render timer, so a burst
+        of toggle, order and name changes ends in a single rebuild.
+        """
+        self._render_timer.start()
+
+    def _render(self) -> None:
         """
         Rebuilds the workspace display based on toggles, ordering, and selected names.
         - '[I-1]', '[I-2]' for multiple interviewers
@@ -102,29 +313,40 @@ class Workspace(QWidget):
         - Fixes 'Show Only Related' to filter out unrelated radio messages
         """
         if not self._raw_logs:
-            self._text_edit.setHtml("<p>No logs loaded</p>")
+            self._show_message("No logs loaded")
             return
 
-        # Retrieve current toggle states (default to True)
-        show_date = self._toggles.get("📅 Tog date", True)
-        show_hour = self._toggles.get("⏰ Tog hour", True)
-        filter_me = self._toggles.get("🙂 Tog /me", True)
-        filter_do = self._toggles.get("🖼️ Tog /do", True)
-        filter_ooc = self._toggles.get("💬 Tog OOC", True)
-        filter_pw = self._toggles.get("📩 Tog PW", True)
-        filter_commands = self._toggles.get("🔧 Tog Commands", True)
-        filter_unrecognized = self._toggles.get("🕵️ Tog Unrecognized", True)
-        filter_radio = self._toggles.get("🚔 Tog Radio", True)
-        filter_action_tags = self._toggles.get("🔖 Tog Action Tags", True)
+        # Toggled off and back on, or the same names re-sent: nothing to redo
+        state = (
+            self._order,
+            self._toggle_states,
+            self._interviewer_order,
+            self._interrogated_order,
+            self._show_only_related,
+            self._max_lines,
+        )
+        if state == self._shown_state:
+            return
+        self._shown_state = state
+
+        # Current toggle states, resolved in on_filter_toggles_updated
+        (
+            show_date,
+            show_hour,
+            filter_me,
+            filter_do,
+            filter_ooc,
+            filter_pw,
+            filter_commands,
+            filter_unrecognized,
+            filter_radio,
+            filter_action_tags,
+        ) = self._toggle_states
         show_only_related = self._show_only_related
 
-        # Sort logs
-        logs_to_iterate = self._raw_logs[:]
-        if self._order == "DESC":
-            logs_to_iterate.reverse()
-
-        table_rows = []
-        row_index = 1
+        # Line text after the index column, and its runs, in display order
+        lines: List[str] = []
+        spans: List[_LineRuns] = []
 
         # Selected persons with index mapping (ordering preserved)
         selected_I = {
@@ -133,127 +355,133 @@ class Workspace(QWidget):
         selected_O = {
             name.lower(): idx + 1 for idx, name in enumerate(self._interrogated_order)
         }
-        for line in logs_to_iterate:
-            parsed = self._formatter.parse_line(line)
-            if not parsed:
+        # [I-1], [O-2], ... per selected speaker, built once per render;
+        # interviewers win over interrogated for the same name
+        speaker_tags: Dict[str, Tuple[str, QTextCharFormat]] = {}
+        for tag_letter, selected, color in (("O", selected_O, "#FF0000"), ("I", selected_I, "#00FF00")):
+            tag_format = _char_format(color)
+            for name, number in selected.items():
+                addnotation = f"-{number}" if len(selected) > 1 else ""
+                speaker_tags[name] = (f"[{tag_letter}{addnotation}]", tag_format)
+
+        timestamp_variant = (show_date << 1) | show_hour
+        timestamp_format = _char_format("#00BFFF")
+        # Actions whose toggle is off, checked with one lookup per line
+        hidden_actions = {
+            action
+            for action, shown in (
+                ("Akcja /me", filter_me),
+                ("Akcja /do", filter_do),
+                ("Czat OOC", filter_ooc),
+                ("PW", filter_pw),
+                ("Komenda", filter_commands),
+            )
+            if not shown
+        }
+        # 'Show only related': one scan per line for any selected name (as a substring)
+        selected_names = [*selected_I, *selected_O]
+        related_search = (
+            re.compile("|".join(map(re.escape, selected_names))).search if selected_names else None
+        )
+
+        # Bound once; the loop below runs for every line on every render
+        add_line = lines.append
+        add_spans = spans.append
+        tag_for = speaker_tags.get
+        hide_radio = not filter_radio
+        utf16_len = _utf16_len
+        # Most lines to emit; without a cap every row fits
+        line_limit = self._max_lines or len(self._rows)
+
+        # Sort logs: walk the rows in display order, without copying them
+        rows = reversed(self._rows) if self._order == "DESC" else self._rows
+        for row in rows:
+            if len(lines) >= line_limit:
+                break  # The cap is reached; later rows would not be shown
+            if not row.parsed:
                 if filter_unrecognized:
                     continue  # Now actually hides unrecognized logs!
-                row_html = f"<td>{row_index}</td><td><pre>{line}</pre></td>"
-                table_rows.append(f"<tr>{row_html}</tr>")
-                row_index += 1
+                add_line(row.body)
+                add_spans(_NO_RUNS)
                 continue
 
-            action = parsed["action"]
-            prefix = parsed.get("prefix", "").strip()
-            message = parsed["message"].strip()
-            is_radio_message = parsed.get("is_radio", False)
+            action = row.action
+            is_radio_message = row.is_radio
 
             # 🔹 FILTERS BASED ON TOGGLES
-            if action == "Akcja /me" and not filter_me:
-                continue
-            if action == "Akcja /do" and not filter_do:
-                continue
-            if action == "Czat OOC" and not filter_ooc:
-                continue
-            if action == "PW" and not filter_pw:
-                continue
-            if action == "Komenda" and not filter_commands:
+            if action in hidden_actions:
                 continue
 
             # 🔹 FILTER RADIO
-            if not filter_radio and is_radio_message:
+            if hide_radio and is_radio_message:
                 continue
 
             # 🔹 FILTER 'SHOW ONLY RELATED'
-            always_show = action == "Komenda"
-            combined_text = f"{prefix} {message}".strip().lower()
-            matching_I = [name for name in selected_I if name in combined_text]
-            matching_O = [name for name in selected_O if name in combined_text]
-
-            if show_only_related and not always_show and not (matching_I or matching_O):
-                if (
-                    is_radio_message
-                    and prefix.lower() not in selected_I
-                    and prefix.lower() not in selected_O
-                ):
-                    continue  # Hides radio messages if the speaker is not in the selected list
-                if not is_radio_message:
-                    continue  # Hides non-radio messages if they are unrelated
-
-            # 🔹 IGNORE [I] and [O] FOR COMMANDS AND PW
-            is_command_or_pw = (
-                message.startswith("/")
-                or message.startswith(".")
-                or message.startswith("[")
-                and not message.startswith("[.")
-            )
+            # (commands are always shown)
+            if show_only_related and action != "Komenda":
+                if related_search is None or not related_search(row.search_text):
+                    if not is_radio_message or (
+                        row.prefix_lower not in selected_I and row.prefix_lower not in selected_O
+                    ):
+                        continue  # Hides unrelated lines; radio ones stay if their speaker is selected
 
             # 🔹 ADDING PREFIXES [I-1], [I-2] and [O-1], [O-2]
-            tag = ""
-            if not is_command_or_pw:
-                # Extract only the speaker's name, ignoring different speaking verbs
-                speaker_name = ""
-                if not prefix and "[Kanał:" in message:
-                    name_pattern = re.compile(
-                        r"\[Kanał: \d+\] ([A-Z][a-z]+ [A-Z][a-z]+):"
-                    )
-                    if match := name_pattern.search(message):
-                        speaker_name = match.group(1).lower()
-                else:
-                    speaker_name = (
-                        prefix.lower()
-                        .replace(" mówi:", "")
-                        .replace(" mówi (radio):", "")
-                        .replace(" mówi (megafon):", "")
-                        .replace(" mówi (krótkofalówka):", "")
-                        .replace(" krzyczy:", "")
-                        .replace(" szepcze:", "")
-                        .strip()
-                    )
-
-                if speaker_name in selected_I:
-                    addnotation = (
-                        f"-{selected_I[speaker_name]}" if len(selected_I) > 1 else ""
-                    )
-                    tag = f'<span style="color: #00FF00; font-weight: bold;">[I{addnotation}]</span> '
-                elif speaker_name in selected_O:
-                    addnotation = (
-                        f"-{selected_O[speaker_name]}" if len(selected_O) > 1 else ""
-                    )
-                    tag = f'<span style="color: #FF0000; font-weight: bold;">[O{addnotation}]</span> '
-
-            # 🔹 REMOVE ACTION TAGS IF TOG ACTION TAGS IS OFF
-            if not filter_action_tags:
-                action_html = ""
-            else:
-                action_color = ACTION_COLOR_MAP.get(action, ACTION_COLOR_MAP["default"])
-                action_html = f'<span style="color: {action_color}; font-weight: bold;">[{action}]</span>'
-
-            # 🔹 CONSTRUCT TIMESTAMP
-            timestamp_parts = []
-            if show_date and parsed.get("date"):
-                timestamp_parts.append(parsed["date"])
-            if show_hour and parsed.get("time"):
-                timestamp_parts.append(parsed["time"])
-            new_timestamp = f"[{' '.join(timestamp_parts)}]" if timestamp_parts else ""
-
-            # 🔹 FORMAT HTML
-            timestamp_html = f'<span style="color: #00BFFF; font-weight: bold;">{new_timestamp}</span>'
-            prefix_html = (
-                f'<span style="color: #FFFFFF; font-weight: bold;">{prefix} </span>'
-                if prefix
-                else ""
-            )
-            message_html = f'<span style="color: #CCCCCC;">{message}</span>'
+            # (never for commands and PW, which have no speaker_name)
+            # None when the speaker is not selected
+            speaker_tag = tag_for(row.speaker_name)
+
+            # 🔹 BUILD LINE (action tags dropped if Tog Action Tags is off)
+            # Each non-empty piece is followed by one space; its run is recorded as it goes,
+            # with head_length tracking the head in UTF-16 units
+            stamp = row.timestamps[timestamp_variant]
+            action_text = row.action_text if filter_action_tags else ""
+            head = ""
+            head_length = 0
+            line_spans = []
+            if stamp:
+                piece_length = utf16_len(stamp)
+                line_spans.append((0, piece_length, timestamp_format))
+                head = stamp + " "
+                head_length = piece_length + 1
+            if speaker_tag is not None:
+                tag, tag_format = speaker_tag
+                piece_length = utf16_len(tag)
+                line_spans.append((head_length, piece_length, tag_format))
+                head += tag + " "
+                head_length += piece_length + 1
+            if action_text:
+                piece_length = utf16_len(action_text)
+                line_spans.append((head_length, piece_length, row.action_format))
+                head += action_text + " "
+                head_length += piece_length + 1
+            add_spans((tuple(line_spans), head_length, row.body_spans))
+            add_line(head + row.body)
+
+        # 🔹 RENDER LINES
+        self._show_lines(lines, spans)
+
+    def _show_lines(self, lines: List[str], spans: List[_LineRuns]) -> None:
+        """
+        Shows the lines numbered from 1 in a right-aligned index column,
+        coloured by their runs in `spans`.
+        """
+        width = len(str(len(lines)))  # ASCII digits: as many UTF-16 units as characters
+        self._highlighter.spans = spans
+        self._highlighter.offset = width + 2
+        self._set_text("\n".join(f"{index:>{width}}  {line}" for index, line in enumerate(lines, 1)))
 
-            # 🔹 BUILD TABLE ROW
-            row_html = (
-                f"<td>{row_index}</td><td>{timestamp_html} {tag}"
-                f"{action_html} {prefix_html} {message_html}</td>"
-            )
-            table_rows.append(f"<tr>{row_html}</tr>")
-            row_index += 1
+    def _show_message(self, message: str) -> None:
+        """Shows a single uncoloured notice instead of log lines."""
+        self._highlighter.spans = []
+        self._set_text(message)
 
-        # 🔹 RENDER TABLE
-        table_html = "<table>" + "".join(table_rows) + "</table>"
-        self._text_edit.setHtml(table_html)
+    def _set_text(self, text: str) -> None:
+        """
+        Swaps the editor text with updates off, so it never repaints a
+        half-filled document. setPlainText also highlights every block
+        synchronously; only the layout of off-screen blocks is deferred
+        until they are scrolled into view.
+        """
+        self._text_edit.setUpdatesEnabled(False)
+        self._text_edit.setPlainText(text)
+        self._text_edit.setUpdatesEnabled(True)
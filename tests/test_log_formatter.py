@@ -1,3 +1,4 @@
+import io
 import pytest
 from src.models.log_formatter import LogFormatter
 
@@ -37,6 +38,28 @@ def test_parse_line_radio(formatter: LogFormatter) -> None:
     assert result["message"] == "This is a radio call."
 
 
+def test_parse_line_addressed(formatter: LogFormatter) -> None:
+    """
+    Test parsing a line where the speaker addresses someone directly.
+    The addressee belongs to the prefix, not to the message.
+    """
+    line = "[2.02.2025 22:21:05] [Czat IC] Jane Smith szepcze do John Doe: Psst."
+    result = formatter.parse_line(line)
+    assert result["prefix"] == "Jane Smith szepcze do John Doe:"
+    assert result["message"] == "Psst."
+    assert result["is_radio"] is False
+
+
+def test_parse_line_extra_with_colon(formatter: LogFormatter) -> None:
+    """
+    Test that a colon inside the parenthesised extra does not cut the prefix.
+    """
+    line = "[2.02.2025 22:21:30] [Czat IC] John Doe mówi (kanał: 1): Odbiór."
+    result = formatter.parse_line(line)
+    assert result["prefix"] == "John Doe mówi (kanał: 1):"
+    assert result["message"] == "Odbiór."
+
+
 def test_parse_line_invalid(formatter: LogFormatter) -> None:
     """
     Test that an invalid log line (not matching the pattern) returns None.
@@ -46,6 +69,18 @@ def test_parse_line_invalid(formatter: LogFormatter) -> None:
     assert result is None
 
 
+def test_speaker_name(formatter: LogFormatter) -> None:
+    """
+    speaker_name should return the name NAME_PATTERN extracts from the
+    prefix, and None for lines without a speaker.
+    """
+    assert formatter.speaker_name(
+        "[2.02.2025 22:20:48] [Czat IC] John Doe mówi (radio): Over."
+    ) == "John Doe"
+    assert formatter.speaker_name("[2.02.2025 22:20:01] [Komenda] /me waves") is None
+    assert formatter.speaker_name("This is not a valid log line.") is None
+
+
 def test_format_line_html_structure(formatter: LogFormatter) -> None:
     """
     Test that format_line returns an HTML string that includes:
@@ -76,6 +111,46 @@ def test_format_line_non_matching(formatter: LogFormatter) -> None:
     assert "Invalid log line" in formatted
 
 
+def test_format_line_escapes_text(formatter: LogFormatter) -> None:
+    """
+    format_line should escape '<', '>' and '&' in log text, keeping the
+    entities game logs already contain as single escapes.
+    """
+    line = "[2.02.2025 22:33:11] [PW] [A &#8594; B (70)]: <b>1 -> 2 & 3</b>"
+    formatted = formatter.format_line(line, 1)
+    assert "&lt;b&gt;1 -&gt; 2 &amp; 3&lt;/b&gt;" in formatted
+    assert "A \u2192 B (70)" in formatted
+    assert formatter.format_line("<i>bad</i>", 2) == "<pre>2: &lt;i&gt;bad&lt;/i&gt;</pre>"
+
+
+def test_format_lines_matches_format_line(formatter: LogFormatter) -> None:
+    """
+    format_lines should number lines from `start` and produce exactly
+    what format_line produces for each of them.
+    """
+    lines = [
+        "[2.02.2025 22:19:38] [Czat IC] Jane Smith mówi: Hello world!",
+        "Invalid log line that doesn't match format",
+        "[2.02.2025 22:20:01] [Komenda] /me waves",
+    ]
+    formatted = formatter.format_lines(lines, start=5)
+    assert formatted == [formatter.format_line(line, i) for i, line in enumerate(lines, 5)]
+
+
+def test_format_into_writes_formatted_lines(formatter: LogFormatter) -> None:
+    """
+    format_into should write format_lines output to the stream, one
+    separator after each line.
+    """
+    lines = [
+        "[2.02.2025 22:19:38] [Czat IC] Jane Smith mówi: Hello world!",
+        "Invalid log line that doesn't match format",
+    ]
+    out = io.StringIO()
+    formatter.format_into(out, lines, separator="<br>")
+    assert out.getvalue() == "".join(html + "<br>" for html in formatter.format_lines(lines))
+
+
 def test_parse_timestamp_valid(formatter: LogFormatter) -> None:
     """Test parsing a valid timestamp."""
     date_str, time_str = formatter._parse_timestamp("2.02.2025 22:19:38")
@@ -83,6 +158,12 @@ def test_parse_timestamp_valid(formatter: LogFormatter) -> None:
     assert time_str == "22:19:38"
 
 
+def test_parse_timestamp_month_end(formatter: LogFormatter) -> None:
+    """Test that late-month days are still validated against the calendar."""
+    assert formatter._parse_timestamp("31.12.2024 23:59:59") == ("2024-12-31", "23:59:59")
+    assert formatter._parse_timestamp("31.02.2025 10:00:00") == ("", "")
+
+
 def test_parse_timestamp_invalid(formatter: LogFormatter) -> None:
     """Test parsing an invalid timestamp should return empty strings."""
     date_str, time_str = formatter._parse_timestamp("invalid timestamp")
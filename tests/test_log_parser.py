@@ -29,3 +29,35 @@ def test_load_logs(sample_log_file: str) -> None:
     # Should extract "John Doe" and "Jane Smith" as unique users.
     assert "John Doe" in parser.users
     assert "Jane Smith" in parser.users
+
+
+def test_load_logs_users_with_tags(tmp_path: Path) -> None:
+    """
+    Test that tagged speech "(radio)" and multi-word names are recognised,
+    while lines without a speech marker contribute no users.
+    """
+    log_content = (
+        "[2.02.2025 22:19:38] [Czat IC] Mary Jane Watson mówi (radio): Copy.\n"
+        "[2.02.2025 22:20:48] [Akcja /me] John Doe mówi cicho\n"
+        "[2.02.2025 22:21:00] [Czat IC] Jean-Luc Picard mówi: Engage.\n"
+    )
+    log_file = tmp_path / "tagged_log.txt"
+    log_file.write_text(log_content, encoding="utf-8")
+    parser = LogParser(str(log_file))
+    assert parser.users == {"Mary Jane Watson", "Jean-Luc Picard"}
+
+
+def test_load_logs_first_speaker_per_line(tmp_path: Path) -> None:
+    """
+    Test that any whitespace may precede the speech marker, and that only
+    the first speaker of a line is taken, not names inside quoted speech.
+    """
+    log_content = (
+        "[2.02.2025 22:19:38] [Czat IC] John Doe\tmówi: Hello.\n"
+        "[2.02.2025 22:20:48] [Czat IC] Jane Smith mówi: Max Payne mówi: nie.\n"
+        "[2.02.2025 22:21:00] [Czat IC] Mary Jane Watson mówi  (radio): Copy.\n"
+    )
+    log_file = tmp_path / "quoted_log.txt"
+    log_file.write_text(log_content, encoding="utf-8")
+    parser = LogParser(str(log_file))
+    assert parser.users == {"John Doe", "Jane Smith", "Mary Jane Watson"}
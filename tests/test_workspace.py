@@ -0,0 +1,45 @@
+import os
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtWidgets import QApplication  # noqa: E402
+from src.views.workspace import Workspace  # noqa: E402
+
+
+@pytest.fixture(scope="module")
+def app() -> QApplication:
+    """Fixture returning the (offscreen) QApplication widgets need."""
+    return QApplication.instance() or QApplication([])
+
+
+@pytest.fixture
+def workspace(app: QApplication) -> Workspace:
+    """Fixture returning an empty Workspace."""
+    return Workspace()
+
+
+def _utf16(text: str) -> int:
+    """Length of text in UTF-16 code units, as Qt counts positions."""
+    return len(text.encode("utf-16-le")) // 2
+
+
+def test_runs_cover_text_with_emoji(workspace: Workspace) -> None:
+    """
+    Colour runs should be measured in UTF-16 units, so emoji in the prefix
+    and message neither shift nor shorten the runs after them.
+    """
+    prefix = "John Doe mówi (😀 kanał):"
+    message = "😀😀 hello world"
+    workspace.set_raw_logs([f"[2.02.2025 22:19:38] [Czat IC] {prefix} {message}"])
+    workspace._render()
+
+    block = workspace._text_edit.document().firstBlock()
+    text = block.text()
+    runs = {
+        fmt.format.foreground().color().name(): (fmt.start, fmt.length)
+        for fmt in block.layout().formats()
+    }
+    prefix_start = _utf16(text[:text.index(prefix)])
+    assert runs["#ffffff"] == (prefix_start, _utf16(prefix))
+    assert runs["#cccccc"] == (_utf16(text) - _utf16(message), _utf16(message))